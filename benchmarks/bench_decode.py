@@ -0,0 +1,74 @@
+"""Compare the decode table against per-instruction Enum construction.
+
+Runs the same tight loop on the phase-accurate CPU twice, once with the
+precomputed decode table and once with the original Enum based decoder,
+and reports instructions per second for each.
+
+    python -m benchmarks.bench_decode [--instructions N]
+"""
+from argparse import ArgumentParser
+from io import BytesIO
+from time import perf_counter
+from emu101.emu import EMU
+from emu101.cpu import (
+    CPU,
+    InstructionPhase,
+    IOSelect,
+    AddressSelect,
+    ComputeSelect,
+    SourceSelect,
+    DestSelect,
+    ConditionSelect,
+)
+
+
+# loop: D0=INC D0
+#       IP=@loop
+LOOP = [
+    0b0001010001000111,
+    0b0000000011100111, 0xf000,
+]
+
+
+class EnumDecodeCPU(CPU):
+    """The decoder as it was before the decode table."""
+
+    def _decode_instruction(self):
+        instruction = self.pipeline.pop()
+        self.instruction.value = instruction
+        self._io_select = IOSelect(instruction & 0b1000000000000000)
+        self._address_select = AddressSelect(instruction & 0b0110000000000000)
+        self._comp_select = ComputeSelect(instruction & 0b0001111100000000)
+        self._source_select = SourceSelect(instruction & 0b0000000011000000)
+        self._dest_select = DestSelect(instruction & 0b0000000000111000)
+        self._cond_select = ConditionSelect(instruction & 0b0000000000000111)
+        self._phase = InstructionPhase.EXECUTE_INSTRUCTION
+
+
+def measure(cpu_class, instructions):
+    emu = EMU()
+    emu.cpu = cpu_class(emu.bus)
+    emu.rom.load(BytesIO(b"".join(w.to_bytes(2, "big") for w in LOOP)))
+    cpu = emu.cpu
+    retired = 0
+    start = perf_counter()
+    while retired < instructions:
+        cpu.tick()
+        if cpu._phase is InstructionPhase.EXECUTE_INSTRUCTION:
+            retired += 1
+    return retired / (perf_counter() - start)
+
+
+def main():
+    ap = ArgumentParser()
+    ap.add_argument("--instructions", type=int, default=200000)
+    opts = ap.parse_args()
+    before = measure(EnumDecodeCPU, opts.instructions)
+    after = measure(CPU, opts.instructions)
+    print("enum decode:  {:>12,.0f} instructions/s".format(before))
+    print("decode table: {:>12,.0f} instructions/s".format(after))
+    print("speedup:      {:>12.2f}x".format(after / before))
+
+
+if __name__ == "__main__":
+    main()
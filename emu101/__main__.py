@@ -1,3 +1,5 @@
+import json
+import sys
 from argparse import ArgumentParser, FileType
 from .emu import EMU
 
@@ -5,14 +7,67 @@ from .emu import EMU
 def get_opts():
     ap = ArgumentParser()
     ap.add_argument("PROG", type=FileType('rb'), help="Path to program.")
+    ap.add_argument("--fast", action="store_true", help="Run whole instructions instead of stepping phases.")
+    ap.add_argument("--translate", action="store_true", help="Compile straight-line code into cached Python functions.")
     return ap.parse_args()
 
 
+def _address_range(text):
+    start, _, length = text.partition(":")
+    return int(start, 0), int(length, 0)
+
+
+def get_batch_opts(argv):
+    ap = ArgumentParser(prog="python -m emu101 batch", description="Run one program against many RAM images in parallel.")
+    ap.add_argument("PROG", type=FileType('rb'), help="Path to program.")
+    ap.add_argument("RAM", nargs="*", type=FileType('rb'), help="RAM images, one job each (default: one job with empty RAM).")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="Number of worker processes (default: all cores).")
+    ap.add_argument("--max-instructions", type=int, default=None, help="Instruction budget per job.")
+    ap.add_argument("--ram-at", type=lambda s: int(s, 0), default=0, help="Address RAM images are loaded at.")
+    ap.add_argument("--dump", type=_address_range, action="append", default=[], metavar="START:LEN", help="Memory range to report, may be repeated.")
+    ap.add_argument("--translate", action="store_true", help="Compile straight-line code into cached Python functions.")
+    return ap.parse_args(argv)
+
+
+def batch_main(argv):
+    from .pool import Job, run_jobs
+    opts = get_batch_opts(argv)
+    rom = opts.PROG.read()
+    rams = opts.RAM or [None]
+    jobs = [
+        Job(
+            rom=rom,
+            ram=fp.read() if fp else b"",
+            max_instructions=opts.max_instructions,
+            ranges=tuple(opts.dump),
+            ram_at=opts.ram_at,
+        )
+        for fp in rams
+    ]
+    results = run_jobs(jobs, workers=opts.jobs, translate=opts.translate)
+    json.dump([
+        {
+            "ram": fp.name if fp else None,
+            "registers": result.registers,
+            "halted": result.halted,
+            "instructions": result.instructions,
+            "memory": {
+                "0x{:04x}".format(start): list(words)
+                for (start, _), words in zip(opts.dump, result.memory)
+            },
+        }
+        for fp, result in zip(rams, results)
+    ], sys.stdout, indent=2)
+    print()
+
+
 def main():
+    if sys.argv[1:2] == ["batch"]:
+        return batch_main(sys.argv[2:])
     opts = get_opts()
     emu = EMU()
-    emu.rom.load(opts.PROG)
-    emu.run()
+    emu.rom.map(opts.PROG)
+    emu.run(fast=opts.fast, translate=opts.translate)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,185 @@
+from typing import IO, Dict, Iterable, Optional, Union
+import numpy as np
+from .cpu import _fast_table, _alu_ops
+
+
+# Bus addresses backed by memory in EMU, see EMU.__init__
+RAM_RANGE = (0x0000, 0xEFFF)
+ROM_RANGE = (0xF000, 0x0FFF)
+
+_fields = np.array(_fast_table, dtype=np.int64).T
+_WRITE, _ADDRESS, _COMPUTE, _SOURCE, _DEST, _COND, _SPECIAL = _fields
+
+_writable = np.zeros(0x10000, dtype=bool)
+_writable[RAM_RANGE[0]:RAM_RANGE[0] + RAM_RANGE[1]] = True
+
+
+def _words(fp: IO) -> np.ndarray:
+    return np.frombuffer(fp.read(), dtype=">u2").astype(np.uint16)
+
+
+class BatchEMU:
+    """Many independent EMU machines stepped together with NumPy.
+
+    Every lane has its own registers and full 64K word memory, and all
+    lanes share the memory map of EMU. Each step fetches and decodes one
+    instruction per lane, so lanes that branch differently keep running
+    their own code; conditional stores and writes are masked per lane.
+    A lane that reaches HLT (or BRK) is retired and stops changing.
+    """
+
+    def __init__(self, lanes: int):
+        self.lanes = lanes
+        self.memory = np.zeros((lanes, 0x10000), dtype=np.uint16)
+
+        self.ip = np.full(lanes, 0xf000, dtype=np.int64)
+        self.sp = np.full(lanes, 0x01ff, dtype=np.int64)
+        self.dp = np.full(lanes, 0x0200, dtype=np.int64)
+        self.d0 = np.zeros(lanes, dtype=np.int64)
+        self.d1 = np.zeros(lanes, dtype=np.int64)
+        self.d2 = np.zeros(lanes, dtype=np.int64)
+
+        self.instruction = np.zeros(lanes, dtype=np.int64)
+        self.data_in = np.zeros(lanes, dtype=np.int64)
+        self.alu_out = np.zeros(lanes, dtype=np.int64)
+        self.flags = np.zeros(lanes, dtype=np.int64)
+
+        # Prefetched pipeline word, -1 when the pipeline is empty
+        self.pending = np.full(lanes, -1, dtype=np.int64)
+        self.halted = np.zeros(lanes, dtype=bool)
+        self.breaked = np.zeros(lanes, dtype=bool)
+        self.retired = np.zeros(lanes, dtype=np.int64)
+
+    @property
+    def active(self) -> np.ndarray:
+        return ~(self.halted | self.breaked)
+
+    def load_rom(self, fp: IO, at: int = 0) -> None:
+        """Load the same program into every lane's ROM."""
+        words = _words(fp)
+        start = ROM_RANGE[0] + at
+        if at + len(words) > ROM_RANGE[1]:
+            raise IndexError("array index out of range")
+        self.memory[:, start:start + len(words)] = words
+
+    def load_ram(self, fp: Union[IO, bytes], lanes: Optional[Iterable[int]] = None, at: int = 0) -> None:
+        """Load words into RAM for the given lanes (default: all)."""
+        words = _words(fp) if hasattr(fp, "read") else np.frombuffer(fp, dtype=">u2")
+        start = RAM_RANGE[0] + at
+        if at + len(words) > RAM_RANGE[1]:
+            raise IndexError("array index out of range")
+        rows = slice(None) if lanes is None else np.asarray(list(lanes))
+        self.memory[rows, start:start + len(words)] = words
+
+    def registers(self, lane: int) -> Dict[str, int]:
+        return {
+            name: int(getattr(self, name)[lane])
+            for name in ("ip", "sp", "dp", "d0", "d1", "d2", "instruction", "data_in", "alu_out", "flags")
+        }
+
+    def step(self) -> int:
+        """Execute one instruction on every active lane.
+
+        Returns the number of lanes that executed something.
+        """
+        lanes = np.flatnonzero(self.active)
+        if len(lanes) == 0:
+            return 0
+        mem = self.memory
+
+        # Fetch: top the pipeline up to two words.
+        ip = self.ip[lanes]
+        pending = self.pending[lanes]
+        empty = pending < 0
+        word = np.where(empty, mem[lanes, ip], pending)
+        ip = np.where(empty, (ip + 1) & 0xffff, ip)
+        nxt = mem[lanes, ip].astype(np.int64)
+        ip = (ip + 1) & 0xffff
+        self.ip[lanes] = ip
+        self.pending[lanes] = nxt
+        self.retired[lanes] += 1
+
+        special = _SPECIAL[word]
+        halt = special == 1
+        if halt.any():
+            self.halted[lanes[halt]] = True
+            self.instruction[lanes[halt]] = 0xffff
+        brk = special == 2
+        if brk.any():
+            # BRK is left decoded but not executed, as CPU.run does.
+            self.breaked[lanes[brk]] = True
+            self.retired[lanes[brk]] -= 1
+
+        run = special == 0
+        lanes, word, ip, nxt = lanes[run], word[run], ip[run], nxt[run]
+        if len(lanes) == 0:
+            return len(special)
+
+        write = _WRITE[word].astype(bool)
+        address = _ADDRESS[word]
+        compute = _COMPUTE[word]
+        source = _SOURCE[word]
+        dest = _DEST[word]
+        cond = _COND[word]
+
+        sp = self.sp[lanes]
+        dp = self.dp[lanes]
+        d0 = self.d0[lanes]
+        d1 = self.d1[lanes]
+        d2 = self.d2[lanes]
+        data_in = self.data_in[lanes]
+
+        # ALU, once per distinct operation in flight.
+        result = np.empty(len(lanes), dtype=np.int64)
+        for op in np.unique(compute):
+            m = compute == op
+            result[m] = _alu_ops[op](d0[m], d1[m], d2[m], ip[m], sp[m], dp[m])
+        flags = np.where(result > 0, 4, np.where(result < 0, 1, 2))
+        taken = (flags & cond) != 0
+        alu_out = result & 0xffff
+
+        # Bus
+        on_stack = address == 1
+        push = write & taken & on_stack
+        sp = np.where(push, (sp - 1) & 0xffff, sp)
+        addr = np.choose(address, [dp, sp, (dp + d0) & 0xffff, (sp + d0) & 0xffff])
+        stores = write & taken & _writable[addr]
+        mem[lanes[stores], addr[stores]] = alu_out[stores]
+        reads = ~write
+        data_in = np.where(reads, mem[lanes, addr], data_in)
+        sp = np.where(reads & on_stack, (sp + 1) & 0xffff, sp)
+
+        # Store
+        value = np.choose(source, [np.zeros_like(alu_out), alu_out, data_in, nxt])
+        pending = np.where(source == 3, -1, nxt)
+        d0 = np.where(taken & (dest == 0), value, d0)
+        d1 = np.where(taken & (dest == 1), value, d1)
+        d2 = np.where(taken & (dest == 2), value, d2)
+        jump = taken & (dest == 4)
+        ip = np.where(jump, value, ip)
+        pending = np.where(jump, -1, pending)
+        sp = np.where(taken & (dest == 5), value, sp)
+        dp = np.where(taken & (dest == 6), value, dp)
+
+        self.ip[lanes] = ip
+        self.sp[lanes] = sp
+        self.dp[lanes] = dp
+        self.d0[lanes] = d0
+        self.d1[lanes] = d1
+        self.d2[lanes] = d2
+        self.data_in[lanes] = data_in
+        self.alu_out[lanes] = alu_out
+        self.flags[lanes] = flags
+        self.instruction[lanes] = word
+        self.pending[lanes] = pending
+        return len(special)
+
+    def run(self, max_instructions: Optional[int] = None) -> int:
+        """Step until every lane is retired or the budget is used up.
+
+        Returns the number of steps taken.
+        """
+        steps = 0
+        while steps != max_instructions and self.step():
+            steps += 1
+        return steps
@@ -1,28 +1,93 @@
-from typing import Dict, Tuple, List
+from array import array
+from bisect import bisect_right
+from typing import Callable, Dict, Tuple, List, NamedTuple, Optional
 from .typing import BusInterface, c_uint16
+from .rom import ROM, PAGE_BITS, PAGE_MASK
+
+
+class Region(NamedTuple):
+    start: int
+    end: int
+    # Bus address of the component's address 0
+    base: int
+    comp: BusInterface
+    # Pages of a ROM/RAM so reads skip the component
+    pages: Optional[List[array]]
 
 
 class Bus(BusInterface):
     def __init__(self, memory_map: Dict[Tuple[int, int], BusInterface]):
-        self._map: List[BusInterface] = [None for _ in range(0x10000)]
-        self._comp_offsets = dict()
+        self._regions: List[Region] = []
+        self._starts: List[int] = []
+        self._watched: Optional[bytearray] = None
+        self._on_write: Optional[Callable[[int], None]] = None
         for (start, length), comp in memory_map.items():
-            self._comp_offsets[comp] = start
-            for addr in range(start, start + length):
-                self._map[c_uint16(addr).value] = comp
+            self._map_region(start, length, comp)
+
+    def _map_region(self, start: int, length: int, comp: BusInterface) -> None:
+        """Map comp over [start, start + length), replacing anything there."""
+        end = min(start + length, 0x10000)
+        if end <= start:
+            return
+        regions = []
+        for r in self._regions:
+            # Keep whatever part of an existing region falls outside the new one.
+            if r.start < start:
+                regions.append(r._replace(end=min(r.end, start)))
+            if r.end > end:
+                regions.append(r._replace(start=max(r.start, end)))
+
+        pages = comp._pages if isinstance(comp, ROM) else None
+        regions.append(Region(start, end, start, comp, pages))
+        regions.sort()
+        self._regions = regions
+        self._starts = [r.start for r in regions]
+
+    def watch_writes(self, marks: Optional[bytearray], callback: Callable[[int], None] = None) -> None:
+        """Call callback(addr) after every write to an address marked in marks."""
+        self._watched = marks
+        self._on_write = callback
+
+    def _find(self, addr: int) -> Optional[Region]:
+        i = bisect_right(self._starts, addr) - 1
+        if i < 0:
+            return None
+        region = self._regions[i]
+        return region if addr < region.end else None
 
     def read(self, addr: c_uint16) -> c_uint16:
-        comp: BusInterface = self._map[addr.value]
-        if comp is None:
+        region = self._find(addr.value)
+        if region is None:
             return c_uint16(0)
-        offset = self._comp_offsets[comp]
-        ref_addr = c_uint16(addr.value - offset)
-        return comp.read(ref_addr)
+        return region.comp.read(c_uint16(addr.value - region.base))
 
     def write(self, addr: c_uint16, value: c_uint16) -> None:
-        comp: BusInterface = self._map[addr.value]
-        if comp is None:
+        region = self._find(addr.value)
+        if region is None:
+            return
+        region.comp.write(c_uint16(addr.value - region.base), value)
+        if self._watched is not None and self._watched[addr.value]:
+            self._on_write(addr.value)
+
+    def read_word(self, addr: int) -> int:
+        i = bisect_right(self._starts, addr) - 1
+        if i < 0:
+            return 0
+        start, end, base, comp, pages = self._regions[i]
+        if addr >= end:
+            return 0
+        if pages is not None:
+            addr -= base
+            return pages[addr >> PAGE_BITS][addr & PAGE_MASK]
+        return comp.read_word(addr - base)
+
+    def write_word(self, addr: int, value: int) -> None:
+        i = bisect_right(self._starts, addr) - 1
+        if i < 0:
+            return
+        start, end, base, comp, _ = self._regions[i]
+        if addr >= end:
             return
-        offset = self._comp_offsets[comp]
-        ref_addr = c_uint16(addr.value - offset)
-        comp.write(ref_addr, value)
+        comp.write_word(addr - base, value)
+        if self._watched is not None and self._watched[addr]:
+            self._on_write(addr)
@@ -1,5 +1,6 @@
 from collections import deque
 from enum import Enum, IntFlag
+from typing import NamedTuple, List
 from .typing import c_uint16, CPUInterface
 
 
@@ -91,27 +92,159 @@ class ConditionFlags(IntFlag):
     GT    = 0b100
 
 
+class DecodedInstruction(NamedTuple):
+    io: IOSelect
+    address: AddressSelect
+    compute: ComputeSelect
+    source: SourceSelect
+    dest: DestSelect
+    cond: ConditionSelect
+    halt: bool
+    debug: bool
+
+
+def _build_decode_table() -> List[DecodedInstruction]:
+    """Resolve the control signals for every possible instruction word."""
+    io = {m.value: m for m in IOSelect}
+    address = {m.value: m for m in AddressSelect}
+    compute = {m.value: m for m in ComputeSelect}
+    source = {m.value: m for m in SourceSelect}
+    dest = {m.value: m for m in DestSelect}
+    cond = {m.value: m for m in ConditionSelect}
+
+    table = [
+        DecodedInstruction(
+            io[instruction & 0b1000000000000000],
+            address[instruction & 0b0110000000000000],
+            compute[instruction & 0b0001111100000000],
+            source[instruction & 0b0000000011000000],
+            dest[instruction & 0b0000000000111000],
+            cond[instruction & 0b0000000000000111],
+            False,
+            False,
+        )
+        for instruction in range(0x10000)
+    ]
+
+    # HLT and BRK are special cases that execute as a no-op
+    nop = DecodedInstruction(
+        IOSelect.READ,
+        AddressSelect.DP,
+        ComputeSelect.MINUS_D0D0,
+        SourceSelect.ZERO,
+        DestSelect.D0,
+        ConditionSelect.FALSE,
+        False,
+        False,
+    )
+    table[0xffff] = nop._replace(halt=True)
+    table[0b0101010101010101] = nop._replace(debug=True)
+    return table
+
+
+_decode_table = _build_decode_table()
+
+
+# The fast engine works on plain ints. Each entry holds the select fields
+# shifted down to small indexes:
+#   (write, address, compute, source, dest, cond, special)
+# where special is 1 for HLT and 2 for BRK.
+_fast_table = [
+    (
+        d.io is IOSelect.WRITE,
+        d.address.value >> 13,
+        d.compute.value >> 8,
+        d.source.value >> 6,
+        d.dest.value >> 3,
+        d.cond.value,
+        1 if d.halt else 2 if d.debug else 0,
+    )
+    for d in _decode_table
+]
+
+# ALU operations indexed by the compute field: f(d0, d1, d2, ip, sp, dp)
+_alu_ops = (
+    lambda d0, d1, d2, ip, sp, dp: d0 - d0,
+    lambda d0, d1, d2, ip, sp, dp: d0 - d1,
+    lambda d0, d1, d2, ip, sp, dp: d0 - d2,
+    lambda d0, d1, d2, ip, sp, dp: d0,
+    lambda d0, d1, d2, ip, sp, dp: d0 + d0,
+    lambda d0, d1, d2, ip, sp, dp: d0 + d1,
+    lambda d0, d1, d2, ip, sp, dp: d0 + d2,
+    lambda d0, d1, d2, ip, sp, dp: d1,
+    lambda d0, d1, d2, ip, sp, dp: d0 & d0,
+    lambda d0, d1, d2, ip, sp, dp: d0 & d1,
+    lambda d0, d1, d2, ip, sp, dp: d0 & d2,
+    lambda d0, d1, d2, ip, sp, dp: d2,
+    lambda d0, d1, d2, ip, sp, dp: d0 | d0,
+    lambda d0, d1, d2, ip, sp, dp: d0 | d1,
+    lambda d0, d1, d2, ip, sp, dp: d0 | d2,
+    lambda d0, d1, d2, ip, sp, dp: d0 << 1,
+    lambda d0, d1, d2, ip, sp, dp: d0 ^ d0,
+    lambda d0, d1, d2, ip, sp, dp: d0 ^ d1,
+    lambda d0, d1, d2, ip, sp, dp: d0 ^ d2,
+    lambda d0, d1, d2, ip, sp, dp: ip,
+    lambda d0, d1, d2, ip, sp, dp: d0 + 1,
+    lambda d0, d1, d2, ip, sp, dp: d1 + 1,
+    lambda d0, d1, d2, ip, sp, dp: d2 + 1,
+    lambda d0, d1, d2, ip, sp, dp: sp,
+    lambda d0, d1, d2, ip, sp, dp: d0 - 1,
+    lambda d0, d1, d2, ip, sp, dp: d1 - 1,
+    lambda d0, d1, d2, ip, sp, dp: d2 - 1,
+    lambda d0, d1, d2, ip, sp, dp: dp,
+    lambda d0, d1, d2, ip, sp, dp: ~d0,
+    lambda d0, d1, d2, ip, sp, dp: ~d1,
+    lambda d0, d1, d2, ip, sp, dp: ~d2,
+    lambda d0, d1, d2, ip, sp, dp: d0 >> 1,
+)
+
+
+def _register(name: str) -> property:
+    """Expose an int register through the old c_uint16 interface."""
+    attr = "_" + name
+
+    def fget(self) -> c_uint16:
+        return c_uint16(getattr(self, attr))
+
+    def fset(self, value: c_uint16) -> None:
+        setattr(self, attr, value.value & 0xffff)
+
+    return property(fget, fset)
+
+
 class CPU(CPUInterface):
+    ip = _register("ip")
+    sp = _register("sp")
+    dp = _register("dp")
+    d0 = _register("d0")
+    d1 = _register("d1")
+    d2 = _register("d2")
+    instruction = _register("instruction")
+    immediate = _register("immediate")
+    data_in = _register("data_in")
+    alu_out = _register("alu_out")
+    flags = _register("flags")
+
     def __init__(self, bus):
 
         # Address Registers
-        self.ip = c_uint16(0xf000)
-        self.sp = c_uint16(0x01ff)
-        self.dp = c_uint16(0x0200)
+        self._ip = 0xf000
+        self._sp = 0x01ff
+        self._dp = 0x0200
 
         # Data Registers
-        self.d0 = c_uint16(0)
-        self.d1 = c_uint16(0)
-        self.d2 = c_uint16(0)
+        self._d0 = 0
+        self._d1 = 0
+        self._d2 = 0
 
         # internal registers
-        self.instruction = c_uint16(0)
-        self.immediate = c_uint16(0)
+        self._instruction = 0
+        self._immediate = 0
         self.pipeline = deque()
 
-        self.data_in = c_uint16(0)
-        self.alu_out = c_uint16(0)
-        self.flags = c_uint16(0)
+        self._data_in = 0
+        self._alu_out = 0
+        self._flags = 0
 
         # Other Things
         self._bus = bus
@@ -124,6 +257,7 @@ class CPU(CPUInterface):
         self._dest_select = DestSelect.N1
         self._cond_select = ConditionSelect.FALSE
         self._phase = InstructionPhase.FETCH_INSTRUCTION
+        self._translator = None
         self._tick = {
             InstructionPhase.DECODE_INSTRUCTION: self._decode_instruction,
             InstructionPhase.EXECUTE_INSTRUCTION: self._execute_instruction,
@@ -131,9 +265,9 @@ class CPU(CPUInterface):
         }
 
     def _fetch_pc(self):
-        val = self._bus.read(self.ip)
-        self.ip.value += 1
-        return val.value
+        val = self._bus.read_word(self._ip)
+        self._ip = (self._ip + 1) & 0xffff
+        return val
 
     def _fetch_instruction(self):
         if len(self.pipeline) == 0:
@@ -147,32 +281,20 @@ class CPU(CPUInterface):
     def _decode_instruction(self):
 
         instruction = self.pipeline.pop()
-        self.instruction.value = instruction
+        self._instruction = instruction
 
-        if instruction == 0xffff:
-            # HLT instruction is special case
+        decoded = _decode_table[instruction]
+        if decoded.halt:
             self._halt = True
-            self._io_select = IOSelect.READ
-            self._address_select = AddressSelect.DP
-            self._comp_select = ComputeSelect.MINUS_D0D0
-            self._source_select = SourceSelect.ZERO
-            self._dest_select = DestSelect.D0
-            self._cond_select = ConditionSelect.FALSE
-        elif instruction == 0b0101010101010101:
+        elif decoded.debug:
             self._debug = True
-            self._io_select = IOSelect.READ
-            self._address_select = AddressSelect.DP
-            self._comp_select = ComputeSelect.MINUS_D0D0
-            self._source_select = SourceSelect.ZERO
-            self._dest_select = DestSelect.D0
-            self._cond_select = ConditionSelect.FALSE
-        else:
-            self._io_select = IOSelect(instruction & 0b1000000000000000)
-            self._address_select = AddressSelect(instruction & 0b0110000000000000)
-            self._comp_select = ComputeSelect(instruction & 0b0001111100000000)
-            self._source_select = SourceSelect(instruction & 0b0000000011000000)
-            self._dest_select = DestSelect(instruction & 0b0000000000111000)
-            self._cond_select = ConditionSelect(instruction & 0b0000000000000111)
+
+        self._io_select = decoded.io
+        self._address_select = decoded.address
+        self._comp_select = decoded.compute
+        self._source_select = decoded.source
+        self._dest_select = decoded.dest
+        self._cond_select = decoded.cond
 
         self._phase = InstructionPhase.EXECUTE_INSTRUCTION
 
@@ -184,23 +306,25 @@ class CPU(CPUInterface):
 
     def _execute_store(self):
         val = {
-            SourceSelect.ALU: (lambda: self.alu_out),
-            SourceSelect.DATA: (lambda: self.data_in),
-            SourceSelect.IMMEDIATE: (lambda: c_uint16(self.pipeline.pop())),
-            SourceSelect.ZERO: (lambda: c_uint16(0))
+            SourceSelect.ALU: (lambda: self._alu_out),
+            SourceSelect.DATA: (lambda: self._data_in),
+            SourceSelect.IMMEDIATE: (lambda: self.pipeline.pop()),
+            SourceSelect.ZERO: (lambda: 0)
         }[self._source_select]()
 
-        if bool(self.flags.value & self._cond_select.value):
-            {
-                DestSelect.D0: self.d0,
-                DestSelect.D1: self.d1,
-                DestSelect.D2: self.d2,
-                DestSelect.N1: c_uint16(0),
-                DestSelect.IP: self.ip,
-                DestSelect.SP: self.sp,
-                DestSelect.DP: self.dp,
-                DestSelect.N2: c_uint16(0),
-            }[self._dest_select].value = val.value
+        if bool(self._flags & self._cond_select.value):
+            dest = {
+                DestSelect.D0: "_d0",
+                DestSelect.D1: "_d1",
+                DestSelect.D2: "_d2",
+                DestSelect.N1: None,
+                DestSelect.IP: "_ip",
+                DestSelect.SP: "_sp",
+                DestSelect.DP: "_dp",
+                DestSelect.N2: None,
+            }[self._dest_select]
+            if dest is not None:
+                setattr(self, dest, val)
 
             # if dest is IP, the pipeline needs to be cleared
             if self._dest_select == DestSelect.IP:
@@ -208,88 +332,88 @@ class CPU(CPUInterface):
 
     def _execute_alu(self):
         result = {
-            ComputeSelect.MINUS_D0D0: (lambda: self.d0.value - self.d0.value),
-            ComputeSelect.MINUS_D0D1: (lambda: self.d0.value - self.d1.value),
-            ComputeSelect.MINUS_D0D2: (lambda: self.d0.value - self.d2.value),
-            ComputeSelect.OUT_D0: (lambda: self.d0.value),
-            ComputeSelect.ADD_D0D0: (lambda: self.d0.value + self.d0.value),
-            ComputeSelect.ADD_D0D1: (lambda: self.d0.value + self.d1.value),
-            ComputeSelect.ADD_D0D2: (lambda: self.d0.value + self.d2.value),
-            ComputeSelect.OUT_D1: (lambda: self.d1.value),
-            ComputeSelect.AND_D0D0: (lambda: self.d0.value & self.d0.value),
-            ComputeSelect.AND_D0D1: (lambda: self.d0.value & self.d1.value),
-            ComputeSelect.AND_D0D2: (lambda: self.d0.value & self.d2.value),
-            ComputeSelect.OUT_D2: (lambda: self.d2.value),
-            ComputeSelect.OR_D0D0: (lambda: self.d0.value | self.d0.value),
-            ComputeSelect.OR_D0D1: (lambda: self.d0.value | self.d1.value),
-            ComputeSelect.OR_D0D2: (lambda: self.d0.value | self.d2.value),
-            ComputeSelect.ROLL_D0: (lambda: self.d0.value << 1),
-            ComputeSelect.XOR_D0D0: (lambda: self.d0.value ^ self.d0.value),
-            ComputeSelect.XOR_D0D1: (lambda: self.d0.value ^ self.d1.value),
-            ComputeSelect.XOR_D0D2: (lambda: self.d0.value ^ self.d2.value),
-            ComputeSelect.OUT_IP: (lambda: self.ip.value),
-            ComputeSelect.INC_D0: (lambda: self.d0.value + 1),
-            ComputeSelect.INC_D1: (lambda: self.d1.value + 1),
-            ComputeSelect.INC_D2: (lambda: self.d2.value + 1),
-            ComputeSelect.OUT_SP: (lambda: self.sp.value),
-            ComputeSelect.DEC_D0: (lambda: self.d0.value - 1),
-            ComputeSelect.DEC_D1: (lambda: self.d1.value - 1),
-            ComputeSelect.DEC_D2: (lambda: self.d2.value - 1),
-            ComputeSelect.OUT_DP: (lambda: self.dp.value),
-            ComputeSelect.NOT_D0: (lambda: ~self.d0.value),
-            ComputeSelect.NOT_D1: (lambda: ~self.d1.value),
-            ComputeSelect.NOT_D2: (lambda: ~self.d2.value),
-            ComputeSelect.ROLR_D0: (lambda: self.d0.value >> 1),
+            ComputeSelect.MINUS_D0D0: (lambda: self._d0 - self._d0),
+            ComputeSelect.MINUS_D0D1: (lambda: self._d0 - self._d1),
+            ComputeSelect.MINUS_D0D2: (lambda: self._d0 - self._d2),
+            ComputeSelect.OUT_D0: (lambda: self._d0),
+            ComputeSelect.ADD_D0D0: (lambda: self._d0 + self._d0),
+            ComputeSelect.ADD_D0D1: (lambda: self._d0 + self._d1),
+            ComputeSelect.ADD_D0D2: (lambda: self._d0 + self._d2),
+            ComputeSelect.OUT_D1: (lambda: self._d1),
+            ComputeSelect.AND_D0D0: (lambda: self._d0 & self._d0),
+            ComputeSelect.AND_D0D1: (lambda: self._d0 & self._d1),
+            ComputeSelect.AND_D0D2: (lambda: self._d0 & self._d2),
+            ComputeSelect.OUT_D2: (lambda: self._d2),
+            ComputeSelect.OR_D0D0: (lambda: self._d0 | self._d0),
+            ComputeSelect.OR_D0D1: (lambda: self._d0 | self._d1),
+            ComputeSelect.OR_D0D2: (lambda: self._d0 | self._d2),
+            ComputeSelect.ROLL_D0: (lambda: self._d0 << 1),
+            ComputeSelect.XOR_D0D0: (lambda: self._d0 ^ self._d0),
+            ComputeSelect.XOR_D0D1: (lambda: self._d0 ^ self._d1),
+            ComputeSelect.XOR_D0D2: (lambda: self._d0 ^ self._d2),
+            ComputeSelect.OUT_IP: (lambda: self._ip),
+            ComputeSelect.INC_D0: (lambda: self._d0 + 1),
+            ComputeSelect.INC_D1: (lambda: self._d1 + 1),
+            ComputeSelect.INC_D2: (lambda: self._d2 + 1),
+            ComputeSelect.OUT_SP: (lambda: self._sp),
+            ComputeSelect.DEC_D0: (lambda: self._d0 - 1),
+            ComputeSelect.DEC_D1: (lambda: self._d1 - 1),
+            ComputeSelect.DEC_D2: (lambda: self._d2 - 1),
+            ComputeSelect.OUT_DP: (lambda: self._dp),
+            ComputeSelect.NOT_D0: (lambda: ~self._d0),
+            ComputeSelect.NOT_D1: (lambda: ~self._d1),
+            ComputeSelect.NOT_D2: (lambda: ~self._d2),
+            ComputeSelect.ROLR_D0: (lambda: self._d0 >> 1),
         }[self._comp_select]()
 
-        self.flags.value = (
+        self._flags = (
             ConditionFlags.GT if result > 0 else 0 |
             ConditionFlags.LT if result < 0 else 0 |
             ConditionFlags.EQ if result == 0 else 0
         )
 
-        self.alu_out.value = result
+        self._alu_out = result & 0xffff
 
     def _execute_io(self):
         if self._io_select == IOSelect.READ:
             self._execute_read()
         elif (
             self._io_select == IOSelect.WRITE and
-            bool(self.flags.value & self._cond_select.value)
+            bool(self._flags & self._cond_select.value)
         ):
             self._execute_write()
             
     def _execute_read(self):
         if self._address_select == AddressSelect.DP:
-            self.data_in = self._bus.read(self.dp)
+            self._data_in = self._bus.read_word(self._dp)
 
         elif self._address_select == AddressSelect.SP:
-            self.data_in = self._bus.read(self.sp)
-            self.sp.value += 1
+            self._data_in = self._bus.read_word(self._sp)
+            self._sp = (self._sp + 1) & 0xffff
 
         elif self._address_select == AddressSelect.DPD0:
-            addr = c_uint16(self.dp.value + self.d0.value)
-            self.data_in = self._bus.read(addr)
+            addr = (self._dp + self._d0) & 0xffff
+            self._data_in = self._bus.read_word(addr)
 
         elif self._address_select == AddressSelect.SPD0:
-            addr = c_uint16(self.sp.value + self.d0.value)
-            self.data_in = self._bus.read(addr)
+            addr = (self._sp + self._d0) & 0xffff
+            self._data_in = self._bus.read_word(addr)
 
     def _execute_write(self):
         if self._address_select == AddressSelect.DP:
-            self._bus.write(self.dp, self.alu_out)
+            self._bus.write_word(self._dp, self._alu_out)
 
         elif self._address_select == AddressSelect.SP:
-            self.sp.value -= 1
-            self._bus.write(self.sp, self.alu_out)
+            self._sp = (self._sp - 1) & 0xffff
+            self._bus.write_word(self._sp, self._alu_out)
 
         elif self._address_select == AddressSelect.DPD0:
-            addr = c_uint16(self.dp.value + self.d0.value)
-            self._bus.write(addr, self.alu_out)
+            addr = (self._dp + self._d0) & 0xffff
+            self._bus.write_word(addr, self._alu_out)
 
         elif self._address_select == AddressSelect.SPD0:
-            addr = c_uint16(self.sp.value + self.d0.value)
-            self._bus.write(addr, self.alu_out)
+            addr = (self._sp + self._d0) & 0xffff
+            self._bus.write_word(addr, self._alu_out)
 
     def tick(self):
         if self._halt:
@@ -300,23 +424,294 @@ class CPU(CPUInterface):
             import pdb; pdb.set_trace()
         return not self._halt
 
+    def run(self, max_instructions=None, translate=False):
+        """Execute whole instructions until HLT, BRK or the budget runs out.
+
+        This produces the same architectural state as calling tick() but
+        keeps the registers in locals and skips the phase state machine.
+        With translate, straight-line code is compiled into Python
+        functions and cached (see translate.py). BRK is not executed; it
+        is left decoded in the pipeline so tick() can step through it.
+        Returns the number of instructions executed.
+        """
+        # Finish any partly executed instruction the slow way.
+        while self._phase is not InstructionPhase.FETCH_INSTRUCTION:
+            if not self.tick():
+                return 0
+        if self._halt:
+            return 0
+
+        limit = -1 if max_instructions is None else max_instructions
+        if translate:
+            return self._run_translated(limit)
+        return self._run_interpreted(limit)
+
+    def _run_interpreted(self, limit):
+        read = self._bus.read_word
+        write = self._bus.write_word
+        table = _fast_table
+        alu = _alu_ops
+
+        ip = self._ip
+        sp = self._sp
+        dp = self._dp
+        d0 = self._d0
+        d1 = self._d1
+        d2 = self._d2
+        data_in = self._data_in
+        result = self._alu_out
+        flags = self._flags
+        pending = self.pipeline.pop() if self.pipeline else None
+        instruction = self._instruction
+        count = 0
+
+        while count != limit:
+            if pending is None:
+                word = read(ip)
+                ip = (ip + 1) & 0xffff
+            else:
+                word = pending
+            pending = read(ip)
+            ip = (ip + 1) & 0xffff
+
+            write_, address, compute, source, dest, cond, special = table[word]
+            if special == 2:
+                # Leave BRK in the pipeline for tick() to decode.
+                self._phase = InstructionPhase.DECODE_INSTRUCTION
+                break
+            instruction = word
+            count += 1
+            if special:
+                self._halt = True
+                self._phase = InstructionPhase.EXECUTE_INSTRUCTION
+                break
+
+            result = alu[compute](d0, d1, d2, ip, sp, dp)
+            flags = 4 if result > 0 else 1 if result < 0 else 2
+            taken = flags & cond
+
+            if address == 0:
+                addr = dp
+            elif address == 1:
+                addr = sp
+            elif address == 2:
+                addr = (dp + d0) & 0xffff
+            else:
+                addr = (sp + d0) & 0xffff
+
+            if write_:
+                if taken:
+                    if address == 1:
+                        sp = addr = (sp - 1) & 0xffff
+                    write(addr, result & 0xffff)
+            else:
+                data_in = read(addr)
+                if address == 1:
+                    sp = (sp + 1) & 0xffff
+
+            if source == 1:
+                value = result & 0xffff
+            elif source == 2:
+                value = data_in
+            elif source == 3:
+                value = pending
+                pending = None
+            else:
+                value = 0
+
+            if taken:
+                if dest == 0:
+                    d0 = value
+                elif dest == 1:
+                    d1 = value
+                elif dest == 2:
+                    d2 = value
+                elif dest == 4:
+                    ip = value
+                    pending = None
+                elif dest == 5:
+                    sp = value
+                elif dest == 6:
+                    dp = value
+
+        self._ip = ip
+        self._sp = sp
+        self._dp = dp
+        self._d0 = d0
+        self._d1 = d1
+        self._d2 = d2
+        self._data_in = data_in
+        self._alu_out = result & 0xffff
+        self._flags = flags
+
+        # The pipeline holds the oldest word on the right.
+        if pending is not None:
+            self.pipeline.append(pending)
+        if self._phase is InstructionPhase.DECODE_INSTRUCTION:
+            self.pipeline.append(word)
+
+        if count:
+            self._latch(instruction)
+        return count
+
+    def _run_translated(self, limit):
+        if self._translator is None:
+            from .translate import Translator
+            self._translator = Translator(self._bus)
+        blocks = self._translator.blocks
+        translate = self._translator.translate
+        read = self._bus.read_word
+
+        ip = self._ip
+        sp = self._sp
+        dp = self._dp
+        d0 = self._d0
+        d1 = self._d1
+        d2 = self._d2
+        data_in = self._data_in
+        pending = self.pipeline.pop() if self.pipeline else None
+        result = None
+        count = 0
+
+        while count != limit:
+            if pending is None:
+                pc = ip
+            else:
+                pc = (ip - 1) & 0xffff
+            block = blocks.get(pc)
+            if block is None:
+                block = translate(pc)
+            if (
+                block is None or
+                (limit >= 0 and count + block.length > limit) or
+                (pending is not None and pending != read(pc))
+            ):
+                # Step a single instruction with the interpreter.
+                self._ip = ip
+                self._sp = sp
+                self._dp = dp
+                self._d0 = d0
+                self._d1 = d1
+                self._d2 = d2
+                self._data_in = data_in
+                if pending is not None:
+                    self.pipeline.append(pending)
+                if result is not None:
+                    self._alu_out = result & 0xffff
+                    self._flags = 4 if result > 0 else 1 if result < 0 else 2
+                    self._latch(instruction)
+                    result = None
+                count += self._run_interpreted(1)
+                if self._halt or self._phase is not InstructionPhase.FETCH_INSTRUCTION:
+                    return count
+                ip = self._ip
+                sp = self._sp
+                dp = self._dp
+                d0 = self._d0
+                d1 = self._d1
+                d2 = self._d2
+                data_in = self._data_in
+                pending = self.pipeline.pop() if self.pipeline else None
+                continue
+
+            (
+                d0, d1, d2, sp, dp, ip, pending, result, data_in, executed, instruction
+            ) = block.run(d0, d1, d2, sp, dp, data_in)
+            count += executed
+
+        self._ip = ip
+        self._sp = sp
+        self._dp = dp
+        self._d0 = d0
+        self._d1 = d1
+        self._d2 = d2
+        self._data_in = data_in
+        if pending is not None:
+            self.pipeline.append(pending)
+        if result is not None:
+            self._alu_out = result & 0xffff
+            self._flags = 4 if result > 0 else 1 if result < 0 else 2
+            self._latch(instruction)
+        return count
+
+    def _latch(self, instruction):
+        """Set the instruction register and selects as decode would."""
+        decoded = _decode_table[instruction]
+        self._instruction = instruction
+        self._io_select = decoded.io
+        self._address_select = decoded.address
+        self._comp_select = decoded.compute
+        self._source_select = decoded.source
+        self._dest_select = decoded.dest
+        self._cond_select = decoded.cond
+
+    def registers(self):
+        """The register file as plain ints."""
+        return {
+            "ip": self._ip,
+            "sp": self._sp,
+            "dp": self._dp,
+            "d0": self._d0,
+            "d1": self._d1,
+            "d2": self._d2,
+            "flags": int(self._flags),
+        }
+
+    _state_registers = (
+        "ip", "sp", "dp", "d0", "d1", "d2",
+        "instruction", "immediate", "data_in", "alu_out", "flags",
+    )
+
+    def state(self):
+        """Everything needed to resume this CPU, as plain values."""
+        state = {name: int(getattr(self, "_" + name)) for name in self._state_registers}
+        state.update(
+            pipeline=list(self.pipeline),
+            phase=self._phase.name,
+            halt=self._halt,
+            debug=self._debug,
+            io_select=self._io_select.name,
+            address_select=self._address_select.name,
+            source_select=self._source_select.name,
+            comp_select=self._comp_select.name,
+            dest_select=self._dest_select.name,
+            cond_select=self._cond_select.name,
+        )
+        return state
+
+    def set_state(self, state):
+        for name in self._state_registers:
+            setattr(self, "_" + name, state[name])
+        self.pipeline = deque(state["pipeline"])
+        self._phase = InstructionPhase[state["phase"]]
+        self._halt = state["halt"]
+        self._debug = state["debug"]
+        self._io_select = IOSelect[state["io_select"]]
+        self._address_select = AddressSelect[state["address_select"]]
+        self._source_select = SourceSelect[state["source_select"]]
+        self._comp_select = ComputeSelect[state["comp_select"]]
+        self._dest_select = DestSelect[state["dest_select"]]
+        self._cond_select = ConditionSelect[state["cond_select"]]
+        if self._translator is not None:
+            self._translator.flush()
+
     def core_dump(self):
         print("")
         print("EMU101 Core Dump -------------------")
         print("Panic in phase", self._phase)
         print("")
-        print("ip: {:04x} ({:016b})".format(self.ip.value, self.ip.value))
-        print("sp: {:04x} ({:016b})".format(self.sp.value, self.sp.value))
-        print("dp: {:04x} ({:016b})".format(self.dp.value, self.dp.value))
-        print("d0: {:04x} ({:016b})".format(self.d0.value, self.d0.value))
-        print("d1: {:04x} ({:016b})".format(self.d1.value, self.d1.value))
-        print("d2: {:04x} ({:016b})".format(self.d2.value, self.d2.value))
+        print("ip: {:04x} ({:016b})".format(self._ip, self._ip))
+        print("sp: {:04x} ({:016b})".format(self._sp, self._sp))
+        print("dp: {:04x} ({:016b})".format(self._dp, self._dp))
+        print("d0: {:04x} ({:016b})".format(self._d0, self._d0))
+        print("d1: {:04x} ({:016b})".format(self._d1, self._d1))
+        print("d2: {:04x} ({:016b})".format(self._d2, self._d2))
         print("")
-        print("instruction: {:016b}".format(self.instruction.value))
-        print("immediate:   {:04x}".format(self.immediate.value))
+        print("instruction: {:016b}".format(self._instruction))
+        print("immediate:   {:04x}".format(self._immediate))
         print("pipeline:   [{}]".format(", ".join(["{:04x}".format(v) for v in self.pipeline])))
         print("")
-        print("data_in: {:04x}".format(self.data_in.value))
-        print("alu_out: {:04x}".format(self.alu_out.value))
-        print("flags:   {:016b}".format(self.flags.value))
+        print("data_in: {:04x}".format(self._data_in))
+        print("alu_out: {:04x}".format(self._alu_out))
+        print("flags:   {:016b}".format(self._flags))
         print("")
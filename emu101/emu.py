@@ -1,11 +1,11 @@
 from math import inf
 from typing import IO
 from pprint import pprint as pp
-from ctypes import c_uint16
 from .bus import Bus
 from .ram import RAM
 from .rom import ROM
 from .cpu import CPU
+from .snapshot import Snapshot
 
 
 class EMU:
@@ -18,14 +18,30 @@ class EMU:
         })
         self.cpu = CPU(self.bus)
 
+    def snapshot(self) -> Snapshot:
+        """Capture the machine, the memory is shared copy-on-write."""
+        return Snapshot(
+            cpu=self.cpu.state(),
+            ram=self.ram.share_pages(),
+            rom=self.rom.share_pages(),
+        )
+
+    def restore(self, snap: Snapshot) -> None:
+        """Put the machine in the state captured by snap."""
+        self.ram.restore_pages(snap.ram)
+        self.rom.restore_pages(snap.rom)
+        self.cpu.set_state(snap.cpu)
+
     def core_dump(self):
         self.cpu.core_dump()
 
-    def run(self):
+    def run(self, fast=False, translate=False):
         try:
+            if fast or translate:
+                self.cpu.run(translate=translate)
             while self.cpu.tick(): ...
             self.core_dump()
-            print("ans:", self.bus.read(c_uint16(0x0200)).value)
+            print("ans:", self.bus.read_word(0x0200))
         except:
             self.core_dump()
             raise
@@ -0,0 +1,85 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from mmap import mmap, ACCESS_READ
+from tempfile import NamedTemporaryFile
+from typing import Dict, IO, List, NamedTuple, Optional, Sequence, Tuple
+from .emu import EMU
+
+
+class Job(NamedTuple):
+    rom: bytes
+    # RAM preload image, loaded at ram_at
+    ram: bytes = b""
+    max_instructions: Optional[int] = None
+    # (start, length) bus ranges to return after the run
+    ranges: Tuple[Tuple[int, int], ...] = ()
+    ram_at: int = 0
+
+
+class JobResult(NamedTuple):
+    registers: Dict[str, int]
+    halted: bool
+    instructions: int
+    memory: Tuple[array, ...]
+
+
+# Worker side view of the shared ROM images
+_images: Optional[mmap] = None
+
+
+def _attach(path: str) -> None:
+    global _images
+    with open(path, "rb") as fp:
+        _images = mmap(fp.fileno(), 0, access=ACCESS_READ)
+
+
+def _run(task) -> JobResult:
+    (offset, size), ram, ram_at, max_instructions, ranges, translate = task
+    emu = EMU()
+    emu.rom.load_bytes(memoryview(_images)[offset:offset + size])
+    if ram:
+        emu.ram.load_bytes(ram, ram_at)
+    instructions = emu.cpu.run(max_instructions, translate=translate)
+    read = emu.bus.read_word
+    memory = tuple(
+        array('H', [read((start + i) & 0xffff) for i in range(length)])
+        for start, length in ranges
+    )
+    return JobResult(emu.cpu.registers(), emu.cpu._halt, instructions, memory)
+
+
+def _write_images(jobs: Sequence[Job], fp: IO) -> List[Tuple[int, int]]:
+    """Write each distinct ROM image to fp once, return (offset, size) per job."""
+    placed: Dict[bytes, Tuple[int, int]] = {}
+    offset = 0
+    for job in jobs:
+        if job.rom not in placed:
+            fp.write(job.rom)
+            placed[job.rom] = (offset, len(job.rom))
+            offset += len(job.rom)
+    fp.flush()
+    return [placed[job.rom] for job in jobs]
+
+
+def run_jobs(jobs: Sequence[Job], workers: Optional[int] = None, translate: bool = False) -> List[JobResult]:
+    """Run jobs across a process pool, results are in job order.
+
+    ROM images go to the workers through a memory-mapped temporary file
+    rather than being pickled with every job.
+    """
+    if not jobs:
+        return []
+    with NamedTemporaryFile(prefix="emu101-rom-") as fp:
+        placements = _write_images(jobs, fp)
+        if fp.tell() == 0:
+            fp.write(b"\0")
+            fp.flush()
+        tasks = [
+            (place, job.ram, job.ram_at, job.max_instructions, job.ranges, translate)
+            for place, job in zip(placements, jobs)
+        ]
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(fp.name,)) as pool:
+            return list(pool.map(_run, tasks, chunksize=chunksize))
@@ -4,4 +4,7 @@ from .rom import ROM
 
 class RAM(ROM, BusInterface):
     def write(self, addr: c_uint16, value: c_uint16) -> None:
-        self._data[addr.value].value = value.value
+        self._store(addr.value, value.value)
+
+    def write_word(self, addr: int, value: int) -> None:
+        self._store(addr, value)
@@ -1,21 +1,122 @@
-from typing import IO
+import os
+from array import array
+from mmap import mmap, ACCESS_READ
+from sys import byteorder
+from typing import IO, List, Sequence, Union
 from .typing import BusInterface, c_uint16
 
 
+# Memory is split into pages of 4K words that are copied on write, so a
+# snapshot can share pages with the machine it was taken from.
+PAGE_BITS = 12
+PAGE_SIZE = 1 << PAGE_BITS
+PAGE_MASK = PAGE_SIZE - 1
+
+
 class ROM(BusInterface):
     def __init__(self, size: int) -> None:
-        self._data = [c_uint16(0) for _ in range(size)]
+        self._size = size
+        self._pages: List[array] = [
+            array('H', bytes(min(PAGE_SIZE, size - start) * 2))
+            for start in range(0, size, PAGE_SIZE)
+        ]
+        self._shared = [False] * len(self._pages)
 
     def read(self, addr: c_uint16) -> c_uint16:
-        return self._data[addr.value]
+        return c_uint16(self.read_word(addr.value))
 
     def write(self, addr: c_uint16, value: c_uint16) -> None:
         ...
 
+    def read_word(self, addr: int) -> int:
+        return self._pages[addr >> PAGE_BITS][addr & PAGE_MASK]
+
+    def write_word(self, addr: int, value: int) -> None:
+        ...
+
+    def _store(self, addr: int, value: int) -> None:
+        page = addr >> PAGE_BITS
+        if self._shared[page]:
+            self._pages[page] = array('H', self._pages[page])
+            self._shared[page] = False
+        self._pages[page][addr & PAGE_MASK] = value
+
+    def share_pages(self) -> Sequence[array]:
+        """Hand out the current pages, later writes copy them first."""
+        self._shared = [True] * len(self._pages)
+        return tuple(self._pages)
+
+    def restore_pages(self, pages: Sequence[array]) -> None:
+        """Take over pages from share_pages, copying them on write."""
+        if [len(p) for p in pages] != [len(p) for p in self._pages]:
+            raise ValueError("page layout does not match this memory")
+        self._pages[:] = pages
+        self._shared = [True] * len(self._pages)
+
+    def tobytes(self) -> bytes:
+        """The whole memory as big-endian words, as load() reads them."""
+        data = array('H')
+        for page in self._pages:
+            data.extend(page)
+        if byteorder == "little":
+            data.byteswap()
+        return data.tobytes()
+
     def load(self, fp: IO, at: c_uint16 = None) -> None:
-        addr = at.value if at else 0
-        word = fp.read(2)
-        while word:
-            self._data[c_uint16(addr).value] = c_uint16(int.from_bytes(word, 'big'))
-            word = fp.read(2)
-            addr += 1
+        self.load_bytes(fp.read(), at.value if at else 0)
+
+    def load_bytes(self, data: bytes, at: int = 0) -> None:
+        """Load a big-endian program image, decoded in one pass."""
+        if len(data) % 2:
+            # A trailing odd byte is the low byte of the last word.
+            data = bytes(data[:-1]) + b"\0" + bytes(data[-1:])
+        words = array('H')
+        words.frombytes(data)
+        if byteorder == "little":
+            words.byteswap()
+        if at + len(words) > self._size:
+            raise IndexError("array index out of range")
+
+        done = 0
+        while done < len(words):
+            addr = at + done
+            page, offset = addr >> PAGE_BITS, addr & PAGE_MASK
+            n = min(PAGE_SIZE - offset, len(words) - done)
+            if self._shared[page]:
+                self._pages[page] = array('H', self._pages[page])
+                self._shared[page] = False
+            self._pages[page][offset:offset + n] = words[done:done + n]
+            done += n
+
+    def map(self, path: Union[str, os.PathLike, IO]) -> None:
+        """Load a program image from a file through mmap.
+
+        On a big-endian host the image is already in memory order, so
+        every full page is a read-only view of the mapping itself and the
+        OS shares it between every process that maps the file. Elsewhere
+        the mapping is decoded in one bulk pass without an extra read.
+        Mapped pages are copied if anything writes to them.
+        """
+        if isinstance(path, (str, os.PathLike)):
+            with open(path, "rb") as fp:
+                return self.map(fp)
+        if os.fstat(path.fileno()).st_size == 0:
+            self.load_bytes(b"")
+            return
+        mapping = mmap(path.fileno(), 0, access=ACCESS_READ)
+        if byteorder == "little" or len(mapping) % 2:
+            self.load_bytes(memoryview(mapping))
+            return
+
+        if len(mapping) // 2 > self._size:
+            raise IndexError("array index out of range")
+        words = memoryview(mapping).cast('H')
+        full = len(words) // PAGE_SIZE
+        for page in range(full):
+            if len(self._pages[page]) == PAGE_SIZE:
+                self._pages[page] = words[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+                self._shared[page] = True
+            else:
+                full = page
+                break
+        self.load_bytes(memoryview(mapping)[full * PAGE_SIZE * 2:], full * PAGE_SIZE)
@@ -0,0 +1,64 @@
+import json
+import struct
+from array import array
+from sys import byteorder
+from typing import IO, Any, Dict, NamedTuple, Tuple
+
+
+MAGIC = b"EMU101S\x01"
+
+# Page record: kind (0 all zero, 1 data), word count
+_page_header = struct.Struct(">BI")
+_length = struct.Struct(">I")
+
+
+class Snapshot(NamedTuple):
+    """Machine state captured by EMU.snapshot().
+
+    The memory pages are shared with the machine the snapshot was taken
+    from (and any machine it is restored into) until one of them writes
+    to a page, which then gets its own copy.
+    """
+    cpu: Dict[str, Any]
+    ram: Tuple[array, ...]
+    rom: Tuple[array, ...]
+
+    def save(self, fp: IO) -> None:
+        cpu = json.dumps(self.cpu, sort_keys=True).encode()
+        fp.write(MAGIC)
+        fp.write(_length.pack(len(cpu)))
+        fp.write(cpu)
+        for pages in (self.ram, self.rom):
+            fp.write(_length.pack(len(pages)))
+            for page in pages:
+                if not any(page):
+                    fp.write(_page_header.pack(0, len(page)))
+                    continue
+                fp.write(_page_header.pack(1, len(page)))
+                if byteorder == "little":
+                    page = array('H', page)
+                    page.byteswap()
+                fp.write(page.tobytes())
+
+    @classmethod
+    def load(cls, fp: IO) -> "Snapshot":
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise ValueError("not an EMU101 snapshot")
+        size, = _length.unpack(fp.read(_length.size))
+        cpu = json.loads(fp.read(size))
+        memories = []
+        for _ in range(2):
+            count, = _length.unpack(fp.read(_length.size))
+            pages = []
+            for _ in range(count):
+                kind, words = _page_header.unpack(fp.read(_page_header.size))
+                if kind == 0:
+                    page = array('H', bytes(words * 2))
+                else:
+                    page = array('H', fp.read(words * 2))
+                    if byteorder == "little":
+                        page.byteswap()
+                pages.append(page)
+            memories.append(tuple(pages))
+        ram, rom = memories
+        return cls(cpu, ram, rom)
@@ -0,0 +1,198 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+from .bus import Bus
+from .cpu import _fast_table
+
+
+# Longest run of instructions compiled into one block
+MAX_BLOCK = 64
+
+# ALU expressions indexed by the compute field, {ip} is the value IP holds
+# while the instruction executes.
+_alu_expr = (
+    "d0 - d0", "d0 - d1", "d0 - d2", "d0",
+    "d0 + d0", "d0 + d1", "d0 + d2", "d1",
+    "d0 & d0", "d0 & d1", "d0 & d2", "d2",
+    "d0 | d0", "d0 | d1", "d0 | d2", "d0 << 1",
+    "d0 ^ d0", "d0 ^ d1", "d0 ^ d2", "{ip}",
+    "d0 + 1", "d1 + 1", "d2 + 1", "sp",
+    "d0 - 1", "d1 - 1", "d2 - 1", "dp",
+    "~d0", "~d1", "~d2", "d0 >> 1",
+)
+
+# Condition field as a test on the raw ALU result, TRUE and FALSE are
+# resolved at translation time.
+_cond_expr = {
+    0b001: "r < 0",
+    0b010: "r == 0",
+    0b011: "r <= 0",
+    0b100: "r > 0",
+    0b101: "r != 0",
+    0b110: "r >= 0",
+}
+
+_addr_expr = ("dp", "sp", "(dp + d0) & 0xffff", "(sp + d0) & 0xffff")
+
+_source_expr = ("0", "r & 0xffff", "data_in", "{imm}")
+
+_dest_reg = {0: "d0", 1: "d1", 2: "d2", 5: "sp", 6: "dp"}
+
+
+class Block(NamedTuple):
+    start: int
+    # One past the last word the block was translated from
+    end: int
+    length: int
+    # run(d0, d1, d2, sp, dp, data_in) ->
+    #   (d0, d1, d2, sp, dp, ip, pending, result, data_in, count, instruction)
+    run: Callable
+    source: str
+
+
+class Translator:
+    """Cache of straight-line EMU101 code compiled into Python functions.
+
+    A block starts at any address and runs until an instruction that
+    writes IP, a HLT/BRK, or MAX_BLOCK instructions. Every word a block
+    was built from is watched on the bus, and a write to any of them
+    drops the block. A block that writes into its own code returns right
+    after that instruction so the rest is retranslated.
+    """
+
+    def __init__(self, bus: Bus):
+        self._bus = bus
+        self.blocks: Dict[int, Block] = {}
+        self.code = bytearray(0x10000)
+        self._covers: Dict[int, Set[int]] = {}
+        self._untranslatable: Set[int] = set()
+        bus.watch_writes(self.code, self.invalidate)
+
+    def flush(self) -> None:
+        """Drop every block, needed after memory is changed behind the bus."""
+        self.blocks.clear()
+        self._covers.clear()
+        self._untranslatable.clear()
+        self.code[:] = bytes(0x10000)
+
+    def invalidate(self, addr: int) -> None:
+        for start in self._covers.pop(addr, ()):
+            block = self.blocks.pop(start, None)
+            if block is None:
+                continue
+            for a in self._range(block.start, block.end):
+                covers = self._covers.get(a)
+                if covers is None:
+                    continue
+                covers.discard(start)
+                if not covers:
+                    del self._covers[a]
+                    self.code[a] = 0
+        self._untranslatable.clear()
+
+    @staticmethod
+    def _range(start: int, end: int) -> List[int]:
+        if end <= start:
+            end += 0x10000
+        return [a & 0xffff for a in range(start, end)]
+
+    def _is_memory(self, addr: int) -> bool:
+        region = self._bus._find(addr)
+        return region is not None and region.pages is not None
+
+    def translate(self, start: int) -> Optional[Block]:
+        """Build, cache and return the block at start.
+
+        Returns None when the first instruction can not be translated, a
+        HLT or BRK, or code outside ROM/RAM.
+        """
+        if start in self._untranslatable:
+            return None
+        read = self._bus.read_word
+        lines = []
+        addr = start
+        count = 0
+        while count < MAX_BLOCK:
+            nxt_addr = (addr + 1) & 0xffff
+            if not self._is_memory(addr) or not self._is_memory(nxt_addr):
+                break
+            word = read(addr)
+            write_, address, compute, source, dest, cond, special = _fast_table[word]
+            if special:
+                break
+            nxt = read(nxt_addr)
+            count += 1
+
+            if source == 3:
+                after = end = (addr + 2) & 0xffff
+                fallthrough = f"{after}, None"
+            else:
+                # The next word was prefetched before this one executed.
+                after = nxt_addr
+                end = (addr + 2) & 0xffff
+                fallthrough = f"{end}, {nxt}"
+            exit = "return (d0, d1, d2, sp, dp, {}, r, data_in, %d, %d)" % (count, word)
+
+            lines.append(f"    # {addr:04x}: {word:016b}")
+            lines.append("    r = " + _alu_expr[compute].format(ip=(addr + 2) & 0xffff))
+            taken = "True" if cond == 0b111 else _cond_expr.get(cond)
+            if taken not in (None, "True"):
+                lines.append(f"    t = {taken}")
+                taken = "t"
+
+            if write_ and taken is not None:
+                indent = "    "
+                if taken != "True":
+                    lines.append("    x = 0")
+                    lines.append(f"    if {taken}:")
+                    indent = "        "
+                if address == 1:
+                    lines.append(f"{indent}sp = (sp - 1) & 0xffff")
+                lines.append(f"{indent}a = {_addr_expr[address]}")
+                lines.append(f"{indent}x = code[a]")
+                lines.append(f"{indent}write(a, r & 0xffff)")
+            elif not write_:
+                lines.append(f"    data_in = read({_addr_expr[address]})")
+                if address == 1:
+                    lines.append("    sp = (sp + 1) & 0xffff")
+
+            value = _source_expr[source].format(imm=nxt)
+            if taken is not None and (dest == 4 or dest in _dest_reg):
+                if dest == 4:
+                    store = exit.format(f"{value}, None")
+                else:
+                    store = f"{_dest_reg[dest]} = {value}"
+                if taken == "True":
+                    lines.append(f"    {store}")
+                else:
+                    lines.append(f"    if {taken}:")
+                    lines.append(f"        {store}")
+
+            if write_ and taken is not None:
+                # Wrote over translated code, leave before running stale code.
+                lines.append("    if x:")
+                lines.append("        " + exit.format(fallthrough))
+
+            addr = after
+            if dest == 4 and taken is not None:
+                break
+
+        if count == 0:
+            self._untranslatable.add(start)
+            return None
+        lines.append("    " + exit.format(fallthrough))
+
+        source = "\n".join([
+            "def block(d0, d1, d2, sp, dp, data_in, read=read, write=write, code=code):",
+            *lines,
+        ])
+        namespace = {
+            "read": self._bus.read_word,
+            "write": self._bus.write_word,
+            "code": self.code,
+        }
+        exec(compile(source, f"<block {start:04x}>", "exec"), namespace)
+        block = Block(start, end, count, namespace["block"], source)
+        self.blocks[start] = block
+        for a in self._range(start, end):
+            self._covers.setdefault(a, set()).add(start)
+            self.code[a] = 1
+        return block
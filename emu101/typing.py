@@ -16,3 +16,9 @@ class BusInterface(ABC):
     @abstractmethod
     def write(self, addr: c_uint16, value: c_uint16) -> None:
         ...
+
+    def read_word(self, addr: int) -> int:
+        return self.read(c_uint16(addr)).value
+
+    def write_word(self, addr: int, value: int) -> None:
+        self.write(c_uint16(addr), c_uint16(value))
@@ -5,6 +5,8 @@ from emu101.emu import EMU
 
 
 class LoadRegTest(unittest.TestCase):
+    fast = False
+    translate = False
 
     def setUp(self):
         self.emu = EMU()
@@ -26,7 +28,7 @@ class LoadRegTest(unittest.TestCase):
             0b0000000011110111, 0xabcd, # ldp 0xabcd
             0b1111111111111111, # hlt
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         self.assertEqual(self.emu.cpu.dp.value, 0xabcd)
 
     def test_write_memory_at_dp(self):
@@ -36,7 +38,7 @@ class LoadRegTest(unittest.TestCase):
             0b1000001100111111,         # WD0
             0b1111111111111111,         # HLT
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         self.assertEqual(self.emu.bus.read(c_uint16(0xabcd)).value, 0xbeef)
 
     def test_read_memory_at_dp(self):
@@ -46,7 +48,7 @@ class LoadRegTest(unittest.TestCase):
             0b0000000010000111,         # RD0
             0b1111111111111111,         # HLT
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         self.assertEqual(self.emu.cpu.d0.value, 0xbeef)
 
     def test_jmp_to_immediate(self):
@@ -56,7 +58,7 @@ class LoadRegTest(unittest.TestCase):
             0b0000000011100111, 0x0000, # jmp 0x0000
             0b1111111111111111,         # HLT
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         # It should be 2 because the pipeline was cleared on jump
         self.assertEqual(self.emu.cpu.ip.value, 2)
 
@@ -68,7 +70,7 @@ class LoadRegTest(unittest.TestCase):
             0b0000001101100111,         # JMP
             0b1111111111111111,         # HLT
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         # It should be 2 because the pipeline was cleared on jump
         self.assertEqual(self.emu.cpu.ip.value, 2)
 
@@ -82,7 +84,7 @@ class LoadRegTest(unittest.TestCase):
             0b0000001101100111,         # JMP
             0b1111111111111111,         # HLT
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         self.assertEqual(self.emu.cpu.d0.value, 0xbeef)
 
     def test_instruction_after_jmp_to_immediate(self):
@@ -94,7 +96,7 @@ class LoadRegTest(unittest.TestCase):
             0b0000000011100111, 0x0000, # jmp 0x0000
             0b1111111111111111,         # HLT
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         self.assertEqual(self.emu.cpu.d0.value, 0xbeef)
 
     def test_jsr_and_ret(self):
@@ -109,7 +111,7 @@ class LoadRegTest(unittest.TestCase):
             0b0000000011000111, 0xbeaf, # LD0 0xbeaf
             0b1111111111111111,         # HLT
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         self.assertEqual(self.emu.cpu.d0.value, 0xbeaf)
         self.assertEqual(self.emu.cpu.ip.value, 0xf006)
 
@@ -120,16 +122,24 @@ class LoadRegTest(unittest.TestCase):
             0b1010001101111111,         # push d0
             0b1111111111111111,         # hlt
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
         self.assertEqual(self.emu.bus.read(c_uint16(0x01ff - 1)).value, 0xbeef)
         
     def test_hlt(self):
         self.load_rom([
             0b1111111111111111, #hlt
         ])
-        self.emu.run()
+        self.emu.run(fast=self.fast, translate=self.translate)
 
     def test_loads_pipeline(self):
         self.emu.cpu.tick()
         self.emu.cpu.tick()
         self.assertEqual(len(self.emu.cpu.pipeline), 2)
+
+
+class FastLoadRegTest(LoadRegTest):
+    fast = True
+
+
+class TranslatedLoadRegTest(LoadRegTest):
+    translate = True
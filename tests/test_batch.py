@@ -0,0 +1,67 @@
+import unittest
+from io import BytesIO
+from random import Random
+from emu101.emu import EMU
+from emu101.typing import c_uint16
+
+try:
+    from emu101.batch import BatchEMU
+except ImportError:
+    BatchEMU = None
+
+
+def pack(words):
+    return b"".join(w.to_bytes(2, "big") for w in words)
+
+
+@unittest.skipIf(BatchEMU is None, "numpy is not installed")
+class BatchEMUTest(unittest.TestCase):
+
+    def assertLaneMatches(self, batch, lane, emu):
+        regs = batch.registers(lane)
+        for name, value in regs.items():
+            self.assertEqual(value, getattr(emu.cpu, "_" + name), name)
+        pipeline = list(emu.cpu.pipeline)
+        pending = int(batch.pending[lane])
+        if batch.breaked[lane]:
+            pipeline = pipeline[:1]
+        self.assertEqual([pending] if pending >= 0 else [], pipeline)
+        self.assertEqual(bool(batch.halted[lane]), emu.cpu._halt)
+        self.assertEqual(batch.memory[lane, :0xEFFF].astype('>u2').tobytes(), emu.ram.tobytes())
+
+    def test_matches_emu_per_lane(self):
+        rng = Random(6)
+        rom = pack([rng.randrange(0x10000) for _ in range(128)])
+        rams = [pack([rng.randrange(0x10000) for _ in range(64)]) for _ in range(16)]
+
+        batch = BatchEMU(len(rams))
+        batch.load_rom(BytesIO(rom))
+        for lane, ram in enumerate(rams):
+            batch.load_ram(BytesIO(ram), lanes=[lane], at=0x01f0)
+        batch.run(300)
+
+        for lane, ram in enumerate(rams):
+            emu = EMU()
+            emu.rom.load(BytesIO(rom))
+            emu.ram.load(BytesIO(ram), c_uint16(0x01f0))
+            retired = emu.cpu.run(300)
+            self.assertEqual(retired, int(batch.retired[lane]))
+            self.assertLaneMatches(batch, lane, emu)
+
+    def test_lanes_diverge_and_retire(self):
+        rom = pack([
+            0b0000000011110111, 0x0300, # DP=0x0300
+            0b0000000010010111,         # D2=DATA
+            0b0001010001000111,         # loop: D0=INC D0
+            0b0001101001010111,         # D2=DEC D2
+            0b0000101111100101, 0xf003, # IP=@loop?NZ,D2
+            0b1111111111111111,         # HLT
+        ])
+        batch = BatchEMU(4)
+        batch.load_rom(BytesIO(rom))
+        for lane in range(4):
+            batch.load_ram(pack([lane + 1]), lanes=[lane], at=0x0300)
+        batch.run()
+        self.assertTrue(batch.halted.all())
+        self.assertEqual(list(batch.d0), [1, 2, 3, 4])
+        self.assertEqual(list(batch.retired), [6, 9, 12, 15])
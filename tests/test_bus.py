@@ -1,6 +1,9 @@
 import unittest
+from io import BytesIO
 from unittest.mock import MagicMock, Mock
 from emu101.bus import Bus
+from emu101.ram import RAM
+from emu101.rom import ROM
 from emu101.typing import c_uint16, BusInterface
 
 
@@ -25,11 +28,28 @@ class BusTest(unittest.TestCase):
 
     def test_create(self):
         for i in range(0, 5):
-            self.assertEqual(self.bus._map[i], self.m1)
+            self.assertEqual(self.bus._find(i).comp, self.m1)
         for i in range(5, 10):
-            self.assertEqual(self.bus._map[i], self.m2)
+            self.assertEqual(self.bus._find(i).comp, self.m2)
         for i in range(10, 0x10000):
-            self.assertIsNone(self.bus._map[i])
+            self.assertIsNone(self.bus._find(i))
+
+    def test_create_is_one_region_per_component(self):
+        self.assertEqual(
+            [(r.start, r.end, r.comp) for r in self.bus._regions],
+            [(0, 5, self.m1), (5, 10, self.m2)],
+        )
+
+    def test_later_mapping_overrides_earlier(self):
+        m3 = MagicMock(spec=BusInterface)()
+        bus = Bus({
+            (0, 10): self.m1,
+            (4, 2): m3,
+        })
+        self.assertEqual(
+            [(r.start, r.end, r.base, r.comp) for r in bus._regions],
+            [(0, 4, 0, self.m1), (4, 6, 4, m3), (6, 10, 0, self.m1)],
+        )
 
     def test_read_map_offset_at_zero(self):
         for i in range(0, 5):
@@ -75,3 +95,42 @@ class BusTest(unittest.TestCase):
         self.bus.write(c_uint16(11), c_uint16(1))
         self.m1.write.assert_not_called()
         self.m2.write.assert_not_called()
+
+    def test_read_word_map_offset_at_non_zero(self):
+        self.m2.read_word = Mock(return_value=0xbeef)
+        self.assertEqual(self.bus.read_word(7), 0xbeef)
+        self.m2.read_word.assert_called_once_with(2)
+
+    def test_write_word_map_offset_at_non_zero(self):
+        self.m2.write_word = Mock()
+        self.bus.write_word(7, 0xbeef)
+        self.m2.write_word.assert_called_once_with(2, 0xbeef)
+
+    def test_read_word_returns_zero_if_no_mapping(self):
+        self.assertEqual(self.bus.read_word(11), 0)
+
+
+class BusMemoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ram = RAM(0x10)
+        self.rom = ROM(0x10)
+        self.bus = Bus({
+            (0x00, 0x10): self.ram,
+            (0x20, 0x10): self.rom,
+        })
+
+    def test_ram_reads_and_writes_backing_store(self):
+        self.bus.write_word(0x03, 0xbeef)
+        self.assertEqual(self.ram.read_word(0x03), 0xbeef)
+        self.assertEqual(self.bus.read_word(0x03), 0xbeef)
+
+    def test_rom_ignores_writes(self):
+        self.rom.load(BytesIO(b'\xbe\xef'), c_uint16(1))
+        self.bus.write_word(0x21, 0x1234)
+        self.assertEqual(self.bus.read_word(0x21), 0xbeef)
+
+    def test_gap_reads_zero(self):
+        self.bus.write_word(0x18, 0x1234)
+        self.assertEqual(self.bus.read_word(0x18), 0)
+        self.assertEqual(self.bus.read_word(0xffff), 0)
@@ -0,0 +1,125 @@
+import unittest
+from io import BytesIO
+from random import Random
+from emu101.emu import EMU
+from emu101.typing import c_uint16
+from emu101.cpu import (
+    _decode_table,
+    InstructionPhase,
+    IOSelect,
+    AddressSelect,
+    ComputeSelect,
+    SourceSelect,
+    DestSelect,
+    ConditionSelect,
+)
+
+
+class DecodeTableTest(unittest.TestCase):
+
+    def test_covers_every_instruction(self):
+        self.assertEqual(len(_decode_table), 0x10000)
+
+    def test_matches_enum_decoding(self):
+        for instruction in range(0, 0x10000, 7):
+            if instruction in (0xffff, 0b0101010101010101):
+                continue
+            decoded = _decode_table[instruction]
+            self.assertIs(decoded.io, IOSelect(instruction & 0b1000000000000000))
+            self.assertIs(decoded.address, AddressSelect(instruction & 0b0110000000000000))
+            self.assertIs(decoded.compute, ComputeSelect(instruction & 0b0001111100000000))
+            self.assertIs(decoded.source, SourceSelect(instruction & 0b0000000011000000))
+            self.assertIs(decoded.dest, DestSelect(instruction & 0b0000000000111000))
+            self.assertIs(decoded.cond, ConditionSelect(instruction & 0b0000000000000111))
+            self.assertFalse(decoded.halt)
+            self.assertFalse(decoded.debug)
+
+    def test_hlt(self):
+        decoded = _decode_table[0xffff]
+        self.assertTrue(decoded.halt)
+        self.assertFalse(decoded.debug)
+        self.assertIs(decoded.dest, DestSelect.D0)
+        self.assertIs(decoded.cond, ConditionSelect.FALSE)
+
+    def test_brk(self):
+        decoded = _decode_table[0b0101010101010101]
+        self.assertTrue(decoded.debug)
+        self.assertFalse(decoded.halt)
+        self.assertIs(decoded.source, SourceSelect.ZERO)
+        self.assertIs(decoded.cond, ConditionSelect.FALSE)
+
+
+class FastEngineTest(unittest.TestCase):
+    registers = ("ip", "sp", "dp", "d0", "d1", "d2", "data_in", "alu_out", "flags", "instruction")
+
+    def make_emu(self, words):
+        emu = EMU()
+        emu.rom.load(BytesIO(b"".join(w.to_bytes(2, "big") for w in words)))
+        return emu
+
+    def step(self, cpu, instructions):
+        """Tick the reference CPU through a number of whole instructions."""
+        for _ in range(instructions):
+            if cpu.pipeline and len(cpu.pipeline) == 2 and cpu.pipeline[-1] == 0b0101010101010101:
+                return
+            while cpu._phase is not InstructionPhase.EXECUTE_INSTRUCTION:
+                if not cpu.tick():
+                    return
+            cpu.tick()
+
+    def assertSameMemory(self, a, b):
+        for addr in range(0x10000):
+            self.assertEqual(
+                a.bus.read(c_uint16(addr)).value,
+                b.bus.read(c_uint16(addr)).value,
+                hex(addr),
+            )
+
+    def assertSameState(self, a, b):
+        for reg in self.registers:
+            self.assertEqual(getattr(a.cpu, reg).value, getattr(b.cpu, reg).value, reg)
+        self.assertEqual(list(a.cpu.pipeline), list(b.cpu.pipeline))
+        self.assertEqual(a.cpu._phase, b.cpu._phase)
+        self.assertEqual(a.cpu._halt, b.cpu._halt)
+        self.assertEqual(a.cpu._dest_select, b.cpu._dest_select)
+
+    def test_random_programs_match_tick(self):
+        rng = Random(101)
+        for _ in range(20):
+            words = [rng.randrange(0x10000) for _ in range(64)]
+            words = [0 if w == 0b0101010101010101 else w for w in words]
+            ref, fast = self.make_emu(words), self.make_emu(words)
+            for _ in range(10):
+                self.step(ref.cpu, 25)
+                fast.cpu.run(25)
+                self.assertSameState(ref, fast)
+            self.assertSameMemory(ref, fast)
+
+    def test_budget(self):
+        emu = self.make_emu([
+            0b0001010001000111,         # D0=INC D0
+            0b0000000011100111, 0xf000, # IP=0xf000
+        ])
+        self.assertEqual(emu.cpu.run(max_instructions=11), 11)
+        self.assertEqual(emu.cpu.d0.value, 6)
+
+    def test_hlt(self):
+        emu = self.make_emu([
+            0b0001010001000111, # D0=INC D0
+            0b1111111111111111, # HLT
+        ])
+        self.assertEqual(emu.cpu.run(), 2)
+        self.assertFalse(emu.cpu.tick())
+        self.assertEqual(emu.cpu.run(), 0)
+        self.assertEqual(emu.cpu.ip.value, 0xf003)
+
+    def test_brk_is_left_for_tick(self):
+        emu = self.make_emu([
+            0b0001010001000111, # D0=INC D0
+            0b0101010101010101, # BRK
+            0b1111111111111111, # HLT
+        ])
+        self.assertEqual(emu.cpu.run(), 1)
+        self.assertEqual(emu.cpu._phase, InstructionPhase.DECODE_INSTRUCTION)
+        self.assertEqual(emu.cpu.pipeline[-1], 0b0101010101010101)
+        self.assertFalse(emu.cpu._debug)
@@ -0,0 +1,43 @@
+import unittest
+from emu101.pool import Job, run_jobs
+
+
+def pack(words):
+    return b"".join(w.to_bytes(2, "big") for w in words)
+
+
+# DP=0x0300, D2=DATA, loop: D0=INC D0, D2=DEC D2, IP=@loop?NZ,D2,
+# DP=0x0301, DATA=D0, HLT
+COUNTER = pack([
+    0b0000000011110111, 0x0300,
+    0b0000000010010111,
+    0b0001010001000111,
+    0b0001101001010111,
+    0b0000101111100101, 0xf003,
+    0b0000000011110111, 0x0301,
+    0b1000001100111111,
+    0b1111111111111111,
+])
+
+
+class PoolTest(unittest.TestCase):
+
+    def test_runs_jobs_in_order(self):
+        jobs = [
+            Job(COUNTER, ram=pack([n]), ram_at=0x0300, ranges=((0x0300, 2),))
+            for n in range(1, 6)
+        ]
+        results = run_jobs(jobs, workers=2)
+        self.assertEqual([r.registers["d0"] for r in results], [1, 2, 3, 4, 5])
+        self.assertEqual([list(r.memory[0]) for r in results], [[n, n] for n in range(1, 6)])
+        self.assertTrue(all(r.halted for r in results))
+
+    def test_budget(self):
+        result, = run_jobs([Job(COUNTER, ram=pack([100]), ram_at=0x0300, max_instructions=10)], workers=1)
+        self.assertFalse(result.halted)
+        self.assertEqual(result.instructions, 10)
+
+    def test_distinct_roms(self):
+        hlt = pack([0b1111111111111111])
+        results = run_jobs([Job(hlt), Job(COUNTER, ram=pack([3]), ram_at=0x0300), Job(hlt)], workers=2)
+        self.assertEqual([r.instructions for r in results], [1, 14, 1])
@@ -23,5 +23,8 @@ class RamTest(unittest.TestCase):
                 continue
             _addr = c_uint16(i)
             self.assertEqual(self.m.read(_addr).value, 0)
-    
 
+    def test_read_write_word(self):
+        self.m.write_word(3, 65274)
+        self.assertEqual(self.m.read_word(3), 65274)
+        self.assertEqual(self.m.read(c_uint16(3)).value, 65274)
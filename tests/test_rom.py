@@ -1,7 +1,8 @@
 import unittest
 from ctypes import c_uint16
 from io import BytesIO
-from emu101.rom import ROM
+from tempfile import NamedTemporaryFile
+from emu101.rom import ROM, PAGE_SIZE
 from random import randint
 
 
@@ -36,3 +37,40 @@ class ROMTest(unittest.TestCase):
         rom.load(fd, c_uint16(50))
         self.assertEqual(rom.read(c_uint16(50)).value, 12026)
         self.assertEqual(rom.read(c_uint16(51)).value, 258)
+
+    def test_load_odd_trailing_byte(self):
+        rom = ROM(2)
+        rom.load(BytesIO(b'\x2e\xfa\x01'))
+        self.assertEqual(rom.read(c_uint16(0)).value, 12026)
+        self.assertEqual(rom.read(c_uint16(1)).value, 1)
+
+    def test_load_past_end(self):
+        rom = ROM(1)
+        with self.assertRaises(IndexError):
+            rom.load(BytesIO(b'\x2e\xfa\x01\x02'))
+
+    def test_load_bytes_across_pages(self):
+        data = b''.join((i & 0xffff).to_bytes(2, 'big') for i in range(PAGE_SIZE + 10))
+        rom = ROM(2 * PAGE_SIZE)
+        rom.load_bytes(data, 5)
+        self.assertEqual(rom.read_word(4), 0)
+        self.assertEqual(rom.read_word(5), 0)
+        self.assertEqual(rom.read_word(PAGE_SIZE + 14), PAGE_SIZE + 9)
+        self.assertEqual(rom.read_word(PAGE_SIZE + 15), 0)
+
+    def test_map(self):
+        data = b''.join(randint(0, 0xffff).to_bytes(2, 'big') for _ in range(PAGE_SIZE + 3))
+        with NamedTemporaryFile() as fp:
+            fp.write(data)
+            fp.flush()
+            rom = ROM(0x1FFF)
+            rom.map(fp.name)
+        expected = ROM(0x1FFF)
+        expected.load(BytesIO(data))
+        self.assertEqual(rom.tobytes(), expected.tobytes())
+
+    def test_map_empty_file(self):
+        with NamedTemporaryFile() as fp:
+            rom = ROM(4)
+            rom.map(fp)
+        self.assertEqual(rom.tobytes(), bytes(8))
@@ -0,0 +1,86 @@
+import unittest
+from io import BytesIO
+from emu101.emu import EMU
+from emu101.snapshot import Snapshot
+
+
+def pack(words):
+    return b"".join(w.to_bytes(2, "big") for w in words)
+
+
+# DP=0x0300, loop: D0=INC D0, DATA=D0, D0=D0 ... IP=@loop
+COUNTER = pack([
+    0b0000000011110111, 0x0300, # DP=0x0300
+    0b0001010001000111,         # loop: D0=INC D0
+    0b1000001100111111,         # DATA=D0
+    0b0000000011100111, 0xf002, # IP=@loop
+])
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emu = EMU()
+        self.emu.rom.load(BytesIO(COUNTER))
+
+    def test_restore_resumes_where_it_left_off(self):
+        self.emu.cpu.run(100)
+        snap = self.emu.snapshot()
+        self.emu.cpu.run(50)
+        expected = self.emu.cpu.state(), self.emu.ram.tobytes()
+
+        self.emu.restore(snap)
+        self.assertEqual(self.emu.cpu.state(), snap.cpu)
+        self.emu.cpu.run(50)
+        self.assertEqual((self.emu.cpu.state(), self.emu.ram.tobytes()), expected)
+
+    def test_restore_mid_instruction(self):
+        for _ in range(7):
+            self.emu.cpu.tick()
+        snap = self.emu.snapshot()
+        for _ in range(40):
+            self.emu.cpu.tick()
+        expected = self.emu.cpu.state()
+
+        other = EMU()
+        other.restore(snap)
+        for _ in range(40):
+            other.cpu.tick()
+        self.assertEqual(other.cpu.state(), expected)
+
+    def test_forks_copy_only_written_pages(self):
+        snap = self.emu.snapshot()
+        a, b = EMU(), EMU()
+        a.restore(snap)
+        b.restore(snap)
+        a.cpu.run(30)
+
+        self.assertEqual(b.ram.read_word(0x0300), 0)
+        self.assertEqual(a.ram.read_word(0x0300), 10)
+        self.assertIsNot(a.ram._pages[0], snap.ram[0])
+        for page, shared in zip(a.ram._pages[1:], snap.ram[1:]):
+            self.assertIs(page, shared)
+        self.assertIs(b.ram._pages[0], snap.ram[0])
+
+    def test_original_is_copied_on_write_after_snapshot(self):
+        snap = self.emu.snapshot()
+        self.emu.cpu.run(30)
+        self.assertEqual(snap.ram[0][0x0300], 0)
+
+    def test_save_and_load(self):
+        self.emu.cpu.run(30)
+        snap = self.emu.snapshot()
+        fp = BytesIO()
+        snap.save(fp)
+        fp.seek(0)
+        loaded = Snapshot.load(fp)
+
+        other = EMU()
+        other.restore(loaded)
+        self.assertEqual(other.cpu.state(), self.emu.cpu.state())
+        self.assertEqual(other.ram.tobytes(), self.emu.ram.tobytes())
+        self.assertEqual(other.rom.tobytes(), self.emu.rom.tobytes())
+
+    def test_load_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            Snapshot.load(BytesIO(b"not a snapshot"))
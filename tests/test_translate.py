@@ -0,0 +1,77 @@
+import unittest
+from io import BytesIO
+from random import Random
+from emu101.emu import EMU
+from emu101.cpu import InstructionPhase
+
+
+class TranslateTest(unittest.TestCase):
+    registers = ("_ip", "_sp", "_dp", "_d0", "_d1", "_d2", "_data_in", "_alu_out", "_flags", "_instruction")
+
+    def make_emu(self, words, at=0):
+        emu = EMU()
+        emu.rom.load(BytesIO(b"".join(w.to_bytes(2, "big") for w in words)))
+        return emu
+
+    def assertSameState(self, a, b):
+        for reg in self.registers:
+            self.assertEqual(getattr(a.cpu, reg), getattr(b.cpu, reg), reg)
+        self.assertEqual(list(a.cpu.pipeline), list(b.cpu.pipeline))
+        self.assertEqual(a.cpu._halt, b.cpu._halt)
+        self.assertEqual(a.cpu._dest_select, b.cpu._dest_select)
+        self.assertEqual(a.ram.tobytes(), b.ram.tobytes())
+
+    def test_loop_is_cached(self):
+        emu = self.make_emu([
+            0b0001010001000111,         # D0=INC D0
+            0b0000000011100111, 0xf000, # IP=0xf000
+        ])
+        self.assertEqual(emu.cpu.run(max_instructions=1000, translate=True), 1000)
+        self.assertEqual(emu.cpu.d0.value, 500)
+        self.assertEqual(list(emu.cpu._translator.blocks), [0xf000])
+
+    def test_random_programs_match_interpreter(self):
+        rng = Random(5)
+        for _ in range(10):
+            words = [rng.randrange(0x10000) for _ in range(64)]
+            words = [0 if w == 0b0101010101010101 else w for w in words]
+            ref, fast = self.make_emu(words), self.make_emu(words)
+            for _ in range(10):
+                a = ref.cpu.run(37)
+                b = fast.cpu.run(37, translate=True)
+                self.assertEqual(a, b)
+                self.assertSameState(ref, fast)
+
+    def test_self_modifying_code(self):
+        emu = EMU()
+        emu.ram.load(BytesIO(b"".join(w.to_bytes(2, "big") for w in [
+            0b0001010001000111,         # 0000: D0=INC D0
+            0b0001010001000111,         # 0001: D0=INC D0
+            0b0000000011000111, 0x0000, # 0002: LD0 0
+            0b0000000011100111, 0x0007, # 0004: IP=0x0007
+            0b0000000000000000,         # 0006: NOP
+            0b0000000011110111, 0x0001, # 0007: DP=0x0001
+            0b0000000011000111, 0xffff, # 0009: D0=0xffff (HLT)
+            0b1000001100111111,         # 000b: DATA=D0
+            0b0000000011000111, 0x0000, # 000c: LD0 0
+            0b0000000011100111, 0x0000, # 000e: IP=0x0000
+        ])))
+        emu.rom.load(BytesIO(b"".join(w.to_bytes(2, "big") for w in [
+            0b0000000011100111, 0x0000, # IP=0x0000
+        ])))
+        emu.cpu.run(translate=True)
+        self.assertTrue(emu.cpu._halt)
+        # The first pass through 0x0000 increments once before hitting the
+        # HLT written over 0x0001.
+        self.assertEqual(emu.cpu.d0.value, 1)
+        self.assertEqual(emu.cpu.ip.value, 0x0003)
+
+    def test_brk_is_left_for_tick(self):
+        emu = self.make_emu([
+            0b0001010001000111, # D0=INC D0
+            0b0101010101010101, # BRK
+            0b1111111111111111, # HLT
+        ])
+        self.assertEqual(emu.cpu.run(translate=True), 1)
+        self.assertEqual(emu.cpu._phase, InstructionPhase.DECODE_INSTRUCTION)
+        self.assertEqual(emu.cpu.pipeline[-1], 0b0101010101010101)